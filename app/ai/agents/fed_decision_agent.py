@@ -1,6 +1,6 @@
 import logging
 import json
-from typing import Union
+from typing import Optional, Union
 
 from pydantic_ai import Agent
 from app.models import FEDDecisionImpact, FailedFEDAnalysis, FEDExpectation, IrrelevantFEDContent
@@ -10,10 +10,17 @@ from app.utils.logger_config import APP_LOGGER_NAME
 logger = logging.getLogger(f"{APP_LOGGER_NAME}.FEDDecisionAgent")
 
 class FEDDecisionAnalyzer:
-    def __init__(self, expectations_path: str = "app/expectations.json"):
+    def __init__(self, expectations_path: str = "app/expectations.json",
+                 agent: Optional[Agent] = None, expectations: Optional[FEDExpectation] = None):
+        """
+        Args:
+            expectations_path (str): Path to the JSON file with the FED expectations.
+            agent (Optional[Agent]): A pre-built agent; if omitted, one is initialized from the expectations.
+            expectations (Optional[FEDExpectation]): Pre-loaded expectations; if omitted, they are loaded from `expectations_path`.
+        """
         self.expectations_path = expectations_path
-        self.expectations = self._load_expectations()
-        self.agent = self._initialize_agent()
+        self.expectations = expectations if expectations is not None else self._load_expectations()
+        self.agent = agent if agent is not None else self._initialize_agent()
         logger.info("FEDDecisionAnalyzer initialized.")
         logger.debug(f"Loaded FED expectations: {self.expectations.model_dump_json(indent=2)}")
 
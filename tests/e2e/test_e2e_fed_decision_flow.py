@@ -11,7 +11,6 @@ pytestmark = pytest.mark.e2e
 assert not AppConfig.PROD_EXECUTION, "E2E tests for simulation mode require PROD_EXECUTION=False in .env.test"
 
 
-@pytest.mark.asyncio
 async def test_e2e_flow_with_dovish_fed_statement(test_app_client, caplog, mocker):
     """
     Tests the complete E2E flow with PROD_EXECUTION=False.
@@ -75,7 +74,6 @@ async def test_e2e_flow_with_dovish_fed_statement(test_app_client, caplog, mocke
     print("Correctly identified log message for simulated Medium-Confidence BUY/LONG order.")
 
 
-@pytest.mark.asyncio
 @pytest.mark.skip(reason="Skipping hawkish scenario for now to focus on one E2E case.")
 async def test_e2e_flow_with_hawkish_fed_statement(test_app_client, caplog, mocker):
     """
@@ -0,0 +1,12 @@
+# tests/unit/ai/conftest.py
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+
+
+@pytest.fixture
+def mock_agent_instance():
+    """Creates a bare mock for the pydantic-ai Agent with an awaitable `run` method."""
+    mock = MagicMock()
+    mock.run = AsyncMock()
+    return mock
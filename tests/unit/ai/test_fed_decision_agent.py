@@ -1,40 +1,36 @@
-import pytest
-from unittest.mock import MagicMock, AsyncMock
+import json
+from collections import namedtuple
 
 from app.ai.agents.fed_decision_agent import FEDDecisionAnalyzer
-from app.models import FEDDecisionImpact, FailedFEDAnalysis
+from app.models import FEDDecisionImpact, FailedFEDAnalysis, FEDExpectation
 
-# Mark all tests in this file to be run with asyncio support
-pytestmark = pytest.mark.asyncio
+# Stand-in for the pydantic-ai run result, which is only accessed via `.output`.
+AgentResult = namedtuple('AgentResult', ['output'])
 
+# Read-only expectations and agent outputs, built once for the whole module.
+EXPECTATIONS = FEDExpectation(expected_interest_rate_change_type="hold", expected_narrative="neutral")
+SUCCESSFUL_ANALYSIS = FEDDecisionImpact(
+    impact_on_bitcoin="positive",
+    confidence=0.95,
+    reasoning="The decision was more dovish than expected.",
+    actual_fed_decision_summary="Rates were held steady."
+)
+FAILED_ANALYSIS = FailedFEDAnalysis(error_message="Could not parse content.")
 
-async def test_fed_analyzer_handles_successful_analysis(mocker):
+
+async def test_fed_analyzer_handles_successful_analysis(mock_agent_instance):
     """
     Tests the success case where the AI agent returns a valid result.
     The test is now async to properly await the analyze_content method.
     """
     # 1. Arrange
-    # Create a mock result that the AI agent should return.
-    mock_ai_output = FEDDecisionImpact(
-        impact_on_bitcoin="positive",
-        confidence=0.95,
-        reasoning="The decision was more dovish than expected.",
-        actual_fed_decision_summary="Rates were held steady."
-    )
-
-    # Use AsyncMock for the agent's 'run' method, as it's an awaitable.
-    mock_agent_instance = MagicMock()
-    # The agent's run method returns a container object with an 'output' attribute.
-    # We configure the mock to return a coroutine that resolves to this object.
-    mock_agent_instance.run = AsyncMock(return_value=MagicMock(output=mock_ai_output))
-
-    # Patch the _initialize_agent method on the class to return our mock instance.
-    mocker.patch('app.ai.agents.fed_decision_agent.FEDDecisionAnalyzer._initialize_agent', return_value=mock_agent_instance)
+    # The agent's 'run' method is an AsyncMock (derived from the Agent spec).
+    # It returns a container object with an 'output' attribute.
+    mock_agent_instance.run.return_value = AgentResult(SUCCESSFUL_ANALYSIS)
 
-    # Patch the loading of expectations to avoid file system access during the unit test.
-    mocker.patch('app.ai.agents.fed_decision_agent.FEDDecisionAnalyzer._load_expectations')
-
-    analyzer = FEDDecisionAnalyzer()
+    # Inject the mock agent and the expectations directly to avoid
+    # file system access and agent initialization during the unit test.
+    analyzer = FEDDecisionAnalyzer(agent=mock_agent_instance, expectations=EXPECTATIONS)
 
     # 2. Act
     # Await the async method call.
@@ -48,25 +44,63 @@ async def test_fed_analyzer_handles_successful_analysis(mocker):
     mock_agent_instance.run.assert_awaited_once_with("Some FED announcement text.")
 
 
-async def test_fed_analyzer_handles_failed_analysis(mocker):
+async def test_fed_analyzer_handles_failed_analysis(mock_agent_instance):
     """
     Tests the failure case where the AI agent returns a failure object.
     """
     # 1. Arrange
-    # Create a mock failure object.
-    mock_ai_failure = FailedFEDAnalysis(error_message="Could not parse content.")
-
-    mock_agent_instance = MagicMock()
-    mock_agent_instance.run = AsyncMock(return_value=MagicMock(output=mock_ai_failure))
-
-    mocker.patch('app.ai.agents.fed_decision_agent.FEDDecisionAnalyzer._initialize_agent', return_value=mock_agent_instance)
-    mocker.patch('app.ai.agents.fed_decision_agent.FEDDecisionAnalyzer._load_expectations')
+    mock_agent_instance.run.return_value = AgentResult(FAILED_ANALYSIS)
 
-    analyzer = FEDDecisionAnalyzer()
+    analyzer = FEDDecisionAnalyzer(agent=mock_agent_instance, expectations=EXPECTATIONS)
 
     # 2. Act
     result = await analyzer.analyze_content("Gibberish text.")
 
     # 3. Assert
     assert isinstance(result, FailedFEDAnalysis)
-    assert "agent failed" in result.error_message
\ No newline at end of file
+    assert "agent failed" in result.error_message
+
+
+def test_fed_analyzer_loads_expectations_from_file_by_default(mocker, mock_agent_instance, tmp_path):
+    """
+    Tests the default construction path used by app.main: the expectations are
+    loaded from `expectations_path` and the agent is built from them.
+    """
+    # 1. Arrange
+    expectations_file = tmp_path / "expectations.json"
+    expectations_file.write_text(json.dumps({
+        "expected_interest_rate_change_type": "decrease",
+        "expected_interest_rate_change_amount": "0.25%",
+        "expected_narrative": "dovish",
+    }))
+    mock_initialize_agent = mocker.patch.object(
+        FEDDecisionAnalyzer, '_initialize_agent', return_value=mock_agent_instance
+    )
+
+    # 2. Act
+    analyzer = FEDDecisionAnalyzer(expectations_path=str(expectations_file))
+
+    # 3. Assert
+    assert analyzer.expectations == FEDExpectation(
+        expected_interest_rate_change_type="decrease",
+        expected_interest_rate_change_amount="0.25%",
+        expected_narrative="dovish",
+    )
+    mock_initialize_agent.assert_called_once()
+    assert analyzer.agent is mock_agent_instance
+
+
+def test_fed_analyzer_skips_loaders_for_injected_arguments(mocker, mock_agent_instance):
+    """Tests that an injected agent and expectations bypass the file and agent loaders."""
+    # 1. Arrange
+    mock_load_expectations = mocker.patch.object(FEDDecisionAnalyzer, '_load_expectations')
+    mock_initialize_agent = mocker.patch.object(FEDDecisionAnalyzer, '_initialize_agent')
+
+    # 2. Act
+    analyzer = FEDDecisionAnalyzer(agent=mock_agent_instance, expectations=EXPECTATIONS)
+
+    # 3. Assert
+    mock_load_expectations.assert_not_called()
+    mock_initialize_agent.assert_not_called()
+    assert analyzer.agent is mock_agent_instance
+    assert analyzer.expectations is EXPECTATIONS
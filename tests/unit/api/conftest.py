@@ -0,0 +1,91 @@
+# tests/unit/api/conftest.py
+
+import contextlib
+
+import pytest
+from unittest.mock import MagicMock, AsyncMock
+from fastapi.testclient import TestClient
+
+
+def _get_app():
+    """
+    Imports the FastAPI app lazily, so that `app.main` (and everything it pulls in)
+    is only imported when an API test actually runs, not during collection.
+    """
+    from app.main import app
+    return app
+
+
+@pytest.fixture(scope="module")
+def mock_analyzer_instance():
+    """Shared FEDDecisionAnalyzer mock; tests set `analyze_content.return_value` as needed."""
+    mock = MagicMock()
+    mock.analyze_content = AsyncMock()
+    return mock
+
+
+@pytest.fixture(scope="module")
+def mock_trade_manager_instance():
+    """Shared TradeDecisionManager mock."""
+    return MagicMock()
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _patch_side_effects(module_mocker):
+    """
+    Patches the lifespan dependencies that talk to external services (Twilio, Bitfinex)
+    once per module. No test configures these, so they never need per-test patching.
+    """
+    module_mocker.patch('app.main.SmsNotifier')
+    module_mocker.patch('app.main.Trader')
+    module_mocker.patch('app.main.BitfinexTrader')
+
+
+@pytest.fixture(scope="module")
+def _lifespan_client(module_mocker, mock_analyzer_instance, mock_trade_manager_instance):
+    """
+    Creates a TestClient whose lifespan is entered only once per test module.
+    The analyzer and trade manager are patched *before* the client is entered, so the
+    module-scoped mocks end up in `app.state`; tests configure their return values.
+    """
+    module_mocker.patch('app.main.FEDDecisionAnalyzer', return_value=mock_analyzer_instance)
+    module_mocker.patch('app.main.TradeDecisionManager', return_value=mock_trade_manager_instance)
+
+    with TestClient(_get_app()) as client:
+        yield client
+
+
+@pytest.fixture
+def api_client(_lifespan_client, mock_analyzer_instance, mock_trade_manager_instance):
+    """Returns the shared lifespan client after resetting the URL set and the shared mocks."""
+    _lifespan_client.app.state.processed_urls.clear()
+    mock_analyzer_instance.reset_mock()
+    mock_trade_manager_instance.reset_mock()
+    return _lifespan_client
+
+
+@contextlib.asynccontextmanager
+async def _noop_lifespan(app):
+    """Replaces the real lifespan; only sets up the in-memory URL set."""
+    app.state.processed_urls = set()
+    yield
+
+
+@pytest.fixture
+def bare_client(monkeypatch):
+    """
+    Creates a TestClient without running the real lifespan, for tests that only need
+    `app.state.processed_urls` and none of the analyzer/trading dependencies.
+    The no-op lifespan replaces the URL set on the shared app, so the previous set is
+    restored afterwards in case a module-scoped lifespan client is still open.
+    """
+    app = _get_app()
+    previous_urls = getattr(app.state, 'processed_urls', None)
+    monkeypatch.setattr(app.router, 'lifespan_context', _noop_lifespan)
+    with TestClient(app) as client:
+        yield client
+
+    if previous_urls is None:
+        del app.state.processed_urls
+    else:
+        app.state.processed_urls = previous_urls
@@ -1,27 +1,26 @@
 import pytest
-from unittest.mock import MagicMock, AsyncMock
-from fastapi.testclient import TestClient
 
-from app.main import app
 from app.models import FEDDecisionImpact, FailedFEDAnalysis, IrrelevantFEDContent
 
 # pytest-Markierung, um sicherzustellen, dass alle Tests als Unit-Tests behandelt werden
 pytestmark = pytest.mark.unit
 
+# Read-only analysis results, built once for the whole module.
+SUCCESSFUL_ANALYSIS = FEDDecisionImpact(
+    impact_on_bitcoin="positive",
+    confidence=0.99,
+    reasoning="Mocked positive impact",
+    actual_fed_decision_summary="Mocked summary"
+)
+FAILED_ANALYSIS = FailedFEDAnalysis(error_message="AI failed spectacularly")
 
-def test_web_monitor_notification_rejects_already_processed_url(mocker):
+
+def test_web_monitor_notification_rejects_already_processed_url(bare_client):
     """
     Tests that a request is rejected with 409 Conflict if its URL is
     already in the 'processed_urls' set for the current session.
     """
     # 1. Arrange
-    # Mocken der Abhängigkeiten, die im Lifespan-Manager initialisiert werden.
-    mocker.patch('app.main.FEDDecisionAnalyzer')
-    mocker.patch('app.main.TradeDecisionManager')
-    mocker.patch('app.main.SmsNotifier')
-    mocker.patch('app.main.Trader')
-    mocker.patch('app.main.BitfinexTrader')
-
     processed_url = "http://test.com/i-am-already-processed"
     payload = {
         "uuid": "test-uuid-processed",
@@ -31,41 +30,30 @@ def test_web_monitor_notification_rejects_already_processed_url(mocker):
         "ip": "127.0.0.1"
     }
 
-    with TestClient(app) as client:
-        # 2. Act: Simuliere den Zustand und sende die Anfrage
-        # Füge die URL manuell zum Set hinzu, um eine bereits verarbeitete URL zu simulieren.
-        client.app.state.processed_urls.add(processed_url)
+    # 2. Act: Simuliere den Zustand und sende die Anfrage
+    # Füge die URL manuell zum Set hinzu, um eine bereits verarbeitete URL zu simulieren.
+    bare_client.app.state.processed_urls.add(processed_url)
 
-        response = client.post("/notify/web-monitor", json=payload)
+    response = bare_client.post("/notify/web-monitor", json=payload)
 
-        # 3. Assert: Überprüfe die Ablehnung
-        assert response.status_code == 409
-        assert "has been processed in this session" in response.json()['detail']
+    # 3. Assert: Überprüfe die Ablehnung
+    assert response.status_code == 409
+    assert "has been processed in this session" in response.json()['detail']
 
-        # Überprüfe, dass die URL immer noch im Set ist
-        assert processed_url in client.app.state.processed_urls
+    # Überprüfe, dass die URL immer noch im Set ist
+    assert processed_url in bare_client.app.state.processed_urls
 
 
-def test_web_monitor_notification_success_flow_adds_url_to_set(mocker):
+@pytest.mark.slow
+def test_web_monitor_notification_success_flow_adds_url_to_set(
+        api_client, mock_analyzer_instance, mock_trade_manager_instance
+):
     """
     Tests the complete success flow and verifies that the URL is added
     to the processed set for the session.
     """
     # 1. Arrange
-    successful_analysis = FEDDecisionImpact(
-        impact_on_bitcoin="positive",
-        confidence=0.99,
-        reasoning="Mocked positive impact",
-        actual_fed_decision_summary="Mocked summary"
-    )
-    mock_analyzer_instance = MagicMock()
-    mock_analyzer_instance.analyze_content = AsyncMock(return_value=successful_analysis)
-    mocker.patch('app.main.FEDDecisionAnalyzer', return_value=mock_analyzer_instance)
-    mock_trade_manager_instance = MagicMock()
-    mocker.patch('app.main.TradeDecisionManager', return_value=mock_trade_manager_instance)
-    mocker.patch('app.main.SmsNotifier')
-    mocker.patch('app.main.Trader')
-    mocker.patch('app.main.BitfinexTrader')
+    mock_analyzer_instance.analyze_content.return_value = SUCCESSFUL_ANALYSIS
 
     unique_url = "http://test.com/unique-url-1"
     payload = {
@@ -78,11 +66,7 @@ def test_web_monitor_notification_success_flow_adds_url_to_set(mocker):
     }
 
     # 2. Act
-    with TestClient(app) as client:
-        # Stelle sicher, dass das Set zu Beginn leer ist
-        client.app.state.processed_urls.clear()
-
-        response = client.post("/notify/web-monitor", json=payload)
+    response = api_client.post("/notify/web-monitor", json=payload)
 
     # 3. Assert
     assert response.status_code == 200
@@ -93,32 +77,24 @@ def test_web_monitor_notification_success_flow_adds_url_to_set(mocker):
     mock_trade_manager_instance.execute_trade_from_analysis.assert_called_once()
 
     # WICHTIG: Überprüfe, ob die URL dem Set hinzugefügt wurde
-    assert unique_url in client.app.state.processed_urls
+    assert unique_url in api_client.app.state.processed_urls
 
 
-def test_web_monitor_notification_analyzer_fails_returns_200(mocker):
+@pytest.mark.slow
+def test_web_monitor_notification_analyzer_fails_returns_200(api_client, mock_analyzer_instance):
     """
     Tests that if the AI analyzer fails, the API returns a 200 OK status
     (or similar success-like code) and the URL is still marked as processed.
     """
     # 1. Arrange
-    failed_analysis = FailedFEDAnalysis(error_message="AI failed spectacularly")
-    mock_analyzer_instance = MagicMock()
-    mock_analyzer_instance.analyze_content = AsyncMock(return_value=failed_analysis)
-    mocker.patch('app.main.FEDDecisionAnalyzer', return_value=mock_analyzer_instance)
-    mocker.patch('app.main.TradeDecisionManager')
-    mocker.patch('app.main.SmsNotifier')
-    mocker.patch('app.main.Trader')
-    mocker.patch('app.main.BitfinexTrader')
+    mock_analyzer_instance.analyze_content.return_value = FAILED_ANALYSIS
 
     fail_url = "http://test.com/unique-url-fail"
     payload = {"uuid": "test-uuid-fail", "type": "web-monitor", "url": fail_url, "content": "bad content",
                "ip": "127.0.0.1"}
 
     # 2. Act
-    with TestClient(app) as client:
-        client.app.state.processed_urls.clear()
-        response = client.post("/notify/web-monitor", json=payload)
+    response = api_client.post("/notify/web-monitor", json=payload)
 
     # 3. Assert - Die Logik wurde geändert!
     assert response.status_code == 200
@@ -126,4 +102,4 @@ def test_web_monitor_notification_analyzer_fails_returns_200(mocker):
     assert "analysis failed" in response.json()["message"]
 
     # WICHTIG: Überprüfe, ob die URL trotzdem als verarbeitet markiert wurde
-    assert fail_url in client.app.state.processed_urls
\ No newline at end of file
+    assert fail_url in api_client.app.state.processed_urls
@@ -0,0 +1,62 @@
+# tests/unit/conftest.py
+
+import ast
+import warnings
+from pathlib import Path
+
+import pytest
+from unittest.mock import Mock
+
+# Directories whose mocks sit on the hot path of every test. `autospec=True` does a full
+# runtime inspection of the patched object on each call, so it is flagged here.
+# Keep bare MagicMock()/AsyncMock() in these patches. Only where spec safety is actually
+# needed, build a spec'd template once at module scope and copy it per test, replacing
+# async methods with a fresh AsyncMock() and never configuring magic methods on the copy.
+AUTOSPEC_GUARDED_DIRS = ("api", "ai")
+
+
+def _find_autospec_calls(path: Path) -> list[int]:
+    """Returns the line numbers of all calls in `path` that pass `autospec=True`."""
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    return [
+        node.lineno
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and any(
+            kw.arg == "autospec" and isinstance(kw.value, ast.Constant) and kw.value.value is True
+            for kw in node.keywords
+        )
+    ]
+
+
+def pytest_collection_modifyitems(config, items):
+    """Warns once per session about `autospec=True` in the guarded test directories."""
+    unit_dir = Path(__file__).parent
+    guarded_dirs = [unit_dir / name for name in AUTOSPEC_GUARDED_DIRS]
+    collected_dirs = {item.path.parent for item in items}
+
+    for guarded_dir in guarded_dirs:
+        if guarded_dir not in collected_dirs:
+            continue
+        for path in sorted(guarded_dir.rglob("*.py")):
+            for lineno in _find_autospec_calls(path):
+                warnings.warn(pytest.PytestWarning(
+                    f"{path.relative_to(config.rootpath)}:{lineno}: avoid autospec=True in hot-path "
+                    f"mocks; keep bare MagicMock()/AsyncMock(), or copy a module-level spec'd template "
+                    f"where spec safety is actually needed."
+                ))
+
+
+@pytest.fixture
+def mock_trader():
+    """
+    Creates a mock for the Trader class. Only plain method calls are used,
+    so the cheaper Mock (without magic method support) is sufficient.
+    """
+    return Mock()
+
+
+@pytest.fixture
+def mock_sms_notifier():
+    """Creates a mock for the SmsNotifier class; like the Trader, a plain Mock suffices."""
+    return Mock()
@@ -1,33 +1,21 @@
 # tests/unit/trading/test_trade_decision_manager.py
 
 import pytest
-from unittest.mock import MagicMock
 
 from app.models import FEDDecisionImpact
 from app.trading.trade_decision_manager import TradeDecisionManager
 from app.config import AppConfig
 
 
-@pytest.fixture
-def mock_trader():
-    """Creates a mock for the Trader class."""
-    return MagicMock()
-
-
-@pytest.fixture
-def mock_sms_notifier():
-    """Creates a mock for the SmsNotifier class."""
-    return MagicMock()
-
-
 @pytest.fixture
 def decision_manager(mock_trader, mock_sms_notifier):
     """Initializes the TradeDecisionManager with mocks for each test."""
     return TradeDecisionManager(trader=mock_trader, sms_notifier=mock_sms_notifier)
 
 
-@pytest.mark.parametrize("impact, confidence, expected_amount, expected_leverage, description", [
-    # Test cases for FED Decision trades
+# Test cases for FED Decision trades:
+# (impact, confidence, expected_amount, expected_leverage, description)
+FED_TRADE_CASES = [
     ("positive", 0.97, AppConfig.ORDER_AMOUNT_FED_BUY_HIGH_CONF, AppConfig.LEVERAGE_FED_BUY_HIGH_CONF,
      "High-Confidence UP"),
     ("positive", 0.93, AppConfig.ORDER_AMOUNT_FED_BUY_MED_CONF, AppConfig.LEVERAGE_FED_BUY_MED_CONF,
@@ -36,49 +24,65 @@ def decision_manager(mock_trader, mock_sms_notifier):
      "High-Confidence DOWN"),
     ("negative", 0.94, AppConfig.ORDER_AMOUNT_FED_SHORT_MED_CONF, AppConfig.LEVERAGE_FED_SHORT_MED_CONF,
      "Medium-Confidence DOWN"),
-])
+]
+
+
 def test_execute_trade_for_fed_decision_triggers_correct_trades(
-        decision_manager, mock_trader, mock_sms_notifier, mocker,
-        impact, confidence, expected_amount, expected_leverage, description
+        decision_manager, mock_trader, mock_sms_notifier, mocker
 ):
     """
     Tests if correct trades are triggered for FED decisions based on confidence and direction.
+    All cases share one set of fixtures; the captured calls are cleared between cases.
     """
     # 1. Arrange
     # Temporarily set PROD_EXECUTION to True for this test to run the trade logic.
     decision_manager.PROD_EXECUTION = True
     # Temporarily patch AppConfig to enable SMS notifications for this test.
     mocker.patch.object(AppConfig, 'SMS_NOTIFICATIONS_ENABLED', True)
-
-    analysis_result = FEDDecisionImpact(
-        impact_on_bitcoin=impact,
-        confidence=confidence,
-        reasoning="Test reasoning",
-        actual_fed_decision_summary="Test summary"
-    )
     content_id = "test-fed-123"
 
-    # 2. Act
-    decision_manager.execute_trade_from_analysis(analysis_result, content_id)
-
-    # 3. Assert
-    # Was the trader's execute_order method called exactly once?
-    mock_trader.execute_order.assert_called_once()
-
-    # Extract the keyword arguments with which execute_order was called
-    call_kwargs = mock_trader.execute_order.call_args.kwargs
-
-    # Verify the arguments are correct
-    assert call_kwargs['symbol'] == AppConfig.TRADE_SYMBOL
-    assert call_kwargs['amount'] == expected_amount
-    assert call_kwargs['leverage'] == expected_leverage
-    assert call_kwargs['limit_offset_percentage'] is not None
-
-    # Was an SMS sent?
-    mock_sms_notifier.send_sms.assert_called_once()
-    sms_body = mock_sms_notifier.send_sms.call_args.args[0]
-    assert description in sms_body
-    assert f"Amt: {expected_amount}" in sms_body
+    # Capture the calls directly instead of introspecting the mocks' call records.
+    captured_orders = []
+    sms_bodies = []
+
+    def capture_order(**kwargs):
+        captured_orders.append(kwargs)
+        return kwargs  # A truthy result marks the order as executed successfully.
+
+    mock_trader.execute_order.side_effect = capture_order
+    mock_sms_notifier.send_sms.side_effect = sms_bodies.append
+
+    for impact, confidence, expected_amount, expected_leverage, description in FED_TRADE_CASES:
+        captured_orders.clear()
+        sms_bodies.clear()
+
+        analysis_result = FEDDecisionImpact(
+            impact_on_bitcoin=impact,
+            confidence=confidence,
+            reasoning="Test reasoning",
+            actual_fed_decision_summary="Test summary"
+        )
+
+        # 2. Act
+        decision_manager.execute_trade_from_analysis(analysis_result, content_id)
+
+        # 3. Assert
+        # Was the trader's execute_order method called exactly once?
+        assert len(captured_orders) == 1, description
+        call_kwargs = captured_orders[0]
+
+        # Verify the arguments are correct
+        assert call_kwargs['symbol'] == AppConfig.TRADE_SYMBOL, description
+        assert call_kwargs['amount'] == expected_amount, description
+        assert call_kwargs['leverage'] == expected_leverage, description
+        assert call_kwargs['limit_offset_percentage'] is not None, description
+
+        # Was exactly one SMS sent?
+        assert len(sms_bodies) == 1, description
+        sms_body = sms_bodies[0]
+        assert description in sms_body
+        assert f"Amt: {expected_amount}" in sms_body, description
+        assert "Status: Succeeded" in sms_body, description
 
 
 def test_execute_trade_does_nothing_for_neutral_impact(decision_manager, mock_trader):